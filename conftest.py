@@ -0,0 +1,2 @@
+# Present so pytest puts the repository root on sys.path and tests can import
+# lambda_firecrawl_scraper however pytest is invoked.
@@ -0,0 +1,51 @@
+import io
+import struct
+import zlib
+
+import pytest
+
+import lambda_firecrawl_scraper as scraper_module
+from lambda_firecrawl_scraper import FirecrawlLambdaScraper, _sniff_image_size
+
+
+def _png_bytes(width: int, height: int) -> bytes:
+    """Build a minimal valid greyscale PNG."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    raw = b''.join(b'\x00' + b'\x00' * width for _ in range(height))
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw))
+            + chunk(b'IEND', b''))
+
+
+def _jpeg_header(width: int, height: int) -> bytes:
+    """Build a JPEG header with an APP0 segment ahead of its SOF0 marker."""
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    sof0 = b'\xff\xc0' + struct.pack('>HBHHB', 11, 8, height, width, 1) + b'\x01\x11\x00'
+    return b'\xff\xd8' + app0 + sof0
+
+
+def test_sniff_png_size():
+    assert _sniff_image_size(io.BytesIO(_png_bytes(1, 1))) == ('PNG', 1, 1)
+
+
+def test_sniff_jpeg_size_from_sof_marker():
+    assert _sniff_image_size(io.BytesIO(_jpeg_header(640, 480))) == ('JPEG', 640, 480)
+
+
+def test_tiny_image_rejected_from_header_when_buffer_at_eof(monkeypatch):
+    # Downloads leave the buffer positioned at EOF; the header check must still see the bytes
+    buffer = io.BytesIO()
+    buffer.write(_png_bytes(1, 1))
+
+    def fail_open(*args, **kwargs):
+        pytest.fail("tiny image reached Image.open")
+    monkeypatch.setattr(scraper_module.Image, 'open', fail_open)
+
+    scraper = FirecrawlLambdaScraper.__new__(FirecrawlLambdaScraper)
+    failed = []
+    scraper._mark_image_failed = lambda image_url, permanent=False: failed.append((image_url, permanent))
+
+    assert scraper._save_validated_image(buffer, 'images/img_test.png', 'https://jiopay.com/pixel.png') is None
+    assert failed == [('https://jiopay.com/pixel.png', True)]